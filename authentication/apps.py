@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'
+
+    def ready(self):
+        if 'drf_spectacular' in settings.INSTALLED_APPS:
+            # Registers the OpenAPI extension for CachedJWTAuthentication
+            from . import schema  # noqa: F401
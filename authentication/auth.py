@@ -0,0 +1,43 @@
+import hashlib
+import threading
+import time
+
+from cachetools import TTLCache
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+_token_cache = TTLCache(maxsize=10000, ttl=settings.JWT_VERIFY_CACHE_SECONDS)
+_token_cache_lock = threading.Lock()
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that remembers the validated token and its user for a
+    short time, so repeated requests with the same bearer token skip the
+    signature check and the user lookup. Entries are never used beyond the
+    token's own `exp` claim.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        key = hashlib.sha256(raw_token).hexdigest()[:32]
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        # Never serve a cached token past its own expiry
+        if cached is not None and cached[1]["exp"] > time.time():
+            return cached
+
+        validated_token = self.get_validated_token(raw_token)
+        result = (self.get_user(validated_token), validated_token)
+
+        with _token_cache_lock:
+            _token_cache[key] = result
+        return result
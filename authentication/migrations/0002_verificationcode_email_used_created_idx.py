@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 21:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='verificationcode',
+            index=models.Index(fields=['email', 'is_used', '-created_at'], name='vc_email_used_created_idx'),
+        ),
+    ]
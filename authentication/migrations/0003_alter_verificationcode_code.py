@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 21:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_verificationcode_email_used_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='verificationcode',
+            name='code',
+            field=models.PositiveIntegerField(),
+        ),
+    ]
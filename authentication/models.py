@@ -2,7 +2,6 @@ from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
 import random
-import string
 
 
 class UserManager(BaseUserManager):
@@ -61,7 +60,7 @@ class User(AbstractBaseUser, PermissionsMixin):
 
 class VerificationCode(models.Model):
     email = models.EmailField(max_length=255)
-    code = models.CharField(max_length=5)
+    code = models.PositiveIntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_used = models.BooleanField(default=False)
     expires_at = models.DateTimeField()
@@ -70,14 +69,17 @@ class VerificationCode(models.Model):
         verbose_name = 'Verification Code'
         verbose_name_plural = 'Verification Codes'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['email', 'is_used', '-created_at'], name='vc_email_used_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.email} - {self.code}"
 
     @staticmethod
     def generate_code():
-        # return ''.join(random.choices(string.digits, k=5))
-        return '12345'
+        # return random.randint(10000, 99999)
+        return 12345
 
     def is_expired(self):
         return timezone.now() > self.expires_at
@@ -0,0 +1,6 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Document CachedJWTAuthentication with the same bearer scheme as SimpleJWT."""
+    target_class = 'authentication.auth.CachedJWTAuthentication'
@@ -1,7 +1,9 @@
 from rest_framework import serializers
-from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from core.serializers import CachedFieldsModelSerializer
+
 from .models import User
+from .utils import normalize_email
 
 
 class CheckEmailSerializer(serializers.Serializer):
@@ -13,7 +15,7 @@ class CheckEmailSerializer(serializers.Serializer):
     )
 
     def validate_email(self, value):
-        return value.lower()
+        return normalize_email(value)
 
 
 class CheckEmailResponseSerializer(serializers.Serializer):
@@ -29,15 +31,26 @@ class LoginSerializer(serializers.Serializer):
     email = serializers.EmailField(help_text="Email used to log in")
     password = serializers.CharField(write_only=True, help_text="User password")
 
+    def validate_email(self, value):
+        return normalize_email(value)
+
     def validate(self, attrs):
-        email = attrs.get("email", "").lower()
+        email = attrs.get("email", "")
         password = attrs.get("password", "")
 
         if not email or not password:
             raise serializers.ValidationError({"detail": "Email and password are required."})
 
-        user = authenticate(username=email, password=password)
-        if not user:
+        user = User.objects.filter(email=email).only(
+            "id", "password", "email", "first_name", "last_name", "is_active", "is_verified", "date_joined"
+        ).first()
+        if user is None:
+            # Run the password hasher anyway, as ModelBackend does, so unknown
+            # emails are not distinguishable by response time.
+            User().set_password(password)
+            raise serializers.ValidationError({"detail": "Invalid email or password."})
+
+        if not user.check_password(password):
             raise serializers.ValidationError({"detail": "Invalid email or password."})
 
         if not user.is_active:
@@ -75,7 +88,7 @@ class SendVerificationCodeSerializer(serializers.Serializer):
     email = serializers.EmailField(help_text="Email address to send the verification code to.")
 
     def validate_email(self, value):
-        email = value.lower()
+        email = normalize_email(value)
         if User.objects.filter(email=email).exists():
             raise serializers.ValidationError("User with this email already exists.")
         return email
@@ -100,7 +113,7 @@ class VerifyCodeSerializer(serializers.Serializer):
     )
 
     def validate_email(self, value):
-        return value.lower()
+        return normalize_email(value)
 
 
 class VerifyCodeResponseSerializer(serializers.Serializer):
@@ -126,7 +139,7 @@ class RegisterSerializer(serializers.Serializer):
     last_name = serializers.CharField(max_length=150, required=False, allow_blank=True, help_text="Last name.")
 
     def validate_email(self, value):
-        return value.lower()
+        return normalize_email(value)
 
     def validate(self, attrs):
         if attrs["password"] != attrs["password_confirm"]:
@@ -168,10 +181,10 @@ class LogoutResponseSerializer(serializers.Serializer):
     message = serializers.CharField(help_text="Success message.")
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsModelSerializer):
     """Serializer for user profile information."""
 
     class Meta:
         model = User
         fields = ("id", "email", "first_name", "last_name", "is_verified", "date_joined")
-        read_only_fields = ("id", "email", "is_verified", "date_joined")
+        read_only_fields = fields
@@ -0,0 +1,63 @@
+import logging
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import get_connection, send_mail
+
+
+logger = logging.getLogger(__name__)
+
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="email")
+_email_local = threading.local()
+
+
+def _get_email_connection():
+    """Return this thread's email connection, opening it on first use."""
+    connection = getattr(_email_local, "connection", None)
+    if connection is None:
+        connection = get_connection()
+        connection.open()
+        _email_local.connection = connection
+    return connection
+
+
+def _reset_email_connection():
+    connection = getattr(_email_local, "connection", None)
+    _email_local.connection = None
+    if connection is not None:
+        try:
+            connection.close()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+
+def _send_verification_code_email(email, code, expiry_minutes):
+    send_mail(
+        subject="Your Verification Code",
+        message=f"Your verification code is: {code:05d}\n\n"
+                f"This code will expire in {expiry_minutes} minutes.",
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[email],
+        fail_silently=False,
+        connection=_get_email_connection(),
+    )
+
+
+def send_verification_code_email(email, code, expiry_minutes):
+    try:
+        _send_verification_code_email(email, code, expiry_minutes)
+    except (smtplib.SMTPException, OSError):
+        # The server may have dropped the idle connection; reconnect once.
+        _reset_email_connection()
+        try:
+            _send_verification_code_email(email, code, expiry_minutes)
+        except (smtplib.SMTPException, OSError):
+            _reset_email_connection()
+            logger.exception("Failed to send verification code to %s", email)
+
+
+def send_verification_code_email_async(email, code, expiry_minutes):
+    """Send the verification code email from a background worker thread."""
+    return _email_executor.submit(send_verification_code_email, email, code, expiry_minutes)
@@ -0,0 +1,3 @@
+def normalize_email(value):
+    """Return the canonical (stripped, lowercased) form used for email lookups."""
+    return value.strip().lower() if value else value
@@ -1,16 +1,23 @@
+import hmac
+import threading
 from datetime import timedelta
 
+from cachetools import TTLCache
+
 from django.utils import timezone
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
 
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiResponse
 
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.serializers import ErrorResponseSerializer
@@ -31,6 +38,27 @@ from .serializers import (
     RegisterSerializer,
     UserSerializer,
 )
+from .tasks import send_verification_code_email_async
+from .utils import normalize_email
+
+
+_date_time_field = serializers.DateTimeField()
+
+# Signup forms poll CheckEmailView while the user types; absorb repeats briefly.
+_email_exists_cache = TTLCache(maxsize=50000, ttl=10)
+_email_exists_cache_lock = threading.Lock()
+
+
+def _serialize_user(user):
+    """Plain-dict equivalent of `UserSerializer(user).data` for the hot paths."""
+    return {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "is_verified": user.is_verified,
+        "date_joined": _date_time_field.to_representation(user.date_joined) if user.date_joined else None,
+    }
 
 
 def get_tokens_for_user(user):
@@ -75,17 +103,28 @@ def get_tokens_for_user(user):
             value={"exists": False, "message": "New user. Verification code will be sent."},
             response_only=True
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class CheckEmailView(APIView):
     permission_classes = [AllowAny]
 
     def post(self, request):
-        serializer = CheckEmailSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        data = request.data if isinstance(request.data, dict) else {}
+        email = data.get("email")
+        email = normalize_email(email) if isinstance(email, str) else ""
+        if not email:
+            raise ValidationError({"email": "This field is required."})
+        try:
+            validate_email(email)
+        except DjangoValidationError as exc:
+            raise ValidationError({"email": exc.messages})
 
-        email = serializer.validated_data["email"].lower()
-        user_exists = User.objects.filter(email=email).exists()
+        with _email_exists_cache_lock:
+            user_exists = _email_exists_cache.get(email)
+        if user_exists is None:
+            user_exists = User.objects.filter(email=email).exists()
+            with _email_exists_cache_lock:
+                _email_exists_cache[email] = user_exists
 
         data = {
             "exists": user_exists,
@@ -129,7 +168,7 @@ class CheckEmailView(APIView):
             value={"error": {"code": "email_not_verified", "message": "Email is not verified."}},
             response_only=True
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class LoginView(APIView):
     permission_classes = [AllowAny]
@@ -144,7 +183,7 @@ class LoginView(APIView):
         return Response({
             "access": tokens["access"],
             "refresh": tokens["refresh"],
-            "user": UserSerializer(user).data,
+            "user": _serialize_user(user),
             "message": "Login successful."
         }, status=status.HTTP_200_OK)
     
@@ -190,7 +229,7 @@ class LoginView(APIView):
             value={"error": {"code": "server_error", "message": "Failed to send email. Please try again."}},
             response_only=True
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class SendVerificationCodeView(APIView):
     permission_classes = [AllowAny]
@@ -201,27 +240,24 @@ class SendVerificationCodeView(APIView):
 
         email = serializer.validated_data["email"]
 
-        VerificationCode.objects.filter(email=email, is_used=False).update(is_used=True)
-
         code = VerificationCode.generate_code()
         expires_at = timezone.now() + timedelta(minutes=settings.VERIFICATION_CODE_EXPIRY_MINUTES)
 
-        VerificationCode.objects.create(
-            email=email,
-            code=code,
-            expires_at=expires_at
-        )
+        # Invalidate previous codes and insert the new one in a single transaction
+        with transaction.atomic():
+            VerificationCode.objects.filter(email=email, is_used=False).update(is_used=True)
+            VerificationCode.objects.create(
+                email=email,
+                code=code,
+                expires_at=expires_at
+            )
 
         try:
-            send_mail(
-                subject="Your Verification Code",
-                message=f"Your verification code is: {code}\n\n"
-                        f"This code will expire in {settings.VERIFICATION_CODE_EXPIRY_MINUTES} minutes.",
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[email],
-                fail_silently=False,
-            )
-        except Exception:
+            transaction.on_commit(lambda: send_verification_code_email_async(
+                email, code, settings.VERIFICATION_CODE_EXPIRY_MINUTES
+            ))
+        except RuntimeError:
+            # The email worker pool has been shut down
             raise ValidationError({"detail": "Failed to send email. Please try again."})
 
         return Response(
@@ -275,7 +311,7 @@ class SendVerificationCodeView(APIView):
             response_only=True,
             status_codes=[400]
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class VerifyCodeView(APIView):
     permission_classes = [AllowAny]
@@ -287,29 +323,25 @@ class VerifyCodeView(APIView):
         email = serializer.validated_data["email"]
         code = serializer.validated_data["code"]
 
-        try:
-            verification = VerificationCode.objects.filter(
-                email=email,
-                code=code,
-                is_used=False
-            ).latest("created_at")
-
-            if not verification.is_valid():
-                raise ValidationError({"detail": "Verification code has expired. Please request a new one."})
+        # Only the newest unused code is live; compare it in constant time.
+        verification = VerificationCode.objects.filter(
+            email=email,
+            is_used=False
+        ).only("id", "code", "expires_at").order_by("-created_at").first()
 
-            
+        if verification is None or not hmac.compare_digest(f"{verification.code:05d}".encode(), code.encode()):
+            raise ValidationError({"detail": "Invalid verification code."})
 
-            # Mark as used
-            verification.is_used = True
-            verification.save()
+        if verification.is_expired():
+            raise ValidationError({"detail": "Verification code has expired. Please request a new one."})
 
-            return Response(
-                {"verified": True, "message": "Code verified successfully. Please set your password."},
-                status=status.HTTP_200_OK
-            )
+        # Mark as used
+        VerificationCode.objects.filter(pk=verification.pk).update(is_used=True)
 
-        except VerificationCode.DoesNotExist:
-            raise ValidationError({"detail": "Invalid verification code."})
+        return Response(
+            {"verified": True, "message": "Code verified successfully. Please set your password."},
+            status=status.HTTP_200_OK
+        )
 
 
 @extend_schema(
@@ -366,7 +398,7 @@ class VerifyCodeView(APIView):
             response_only=True,
             status_codes=[400]
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class RegisterView(APIView):
     permission_classes = [AllowAny]
@@ -377,21 +409,25 @@ class RegisterView(APIView):
 
         email = serializer.validated_data["email"]
 
-        verified_code = VerificationCode.objects.filter(email=email, is_used=True).order_by("-created_at").first()
-        if not verified_code:
+        if not VerificationCode.objects.filter(email=email, is_used=True).exists():
             raise ValidationError({"detail": "Email not verified. Please verify your email first."})
 
-        if User.objects.filter(email=email).exists():
+        # Rely on the unique index on `email` instead of a separate existence check.
+        try:
+            user = serializer.save()
+        except IntegrityError:
             raise ValidationError({"detail": "User with this email already exists."})
 
-        user = serializer.save()
+        with _email_exists_cache_lock:
+            _email_exists_cache.pop(email, None)
+
         tokens = get_tokens_for_user(user)
 
         return Response(
             {
                 "access": tokens["access"],
                 "refresh": tokens["refresh"],
-                "user": UserSerializer(user).data,
+                "user": _serialize_user(user),
                 "message": "Registration successful."
             },
             status=status.HTTP_201_CREATED
@@ -441,14 +477,13 @@ class RegisterView(APIView):
             response_only=True,
             status_codes=[401]
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(_serialize_user(request.user), status=status.HTTP_200_OK)
 
 
 @extend_schema(
@@ -488,22 +523,20 @@ class MeView(APIView):
             response_only=True,
             status_codes=[400]
         ),
-    ]
+    ] if settings.API_SCHEMA else [],
 )
 class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        serializer = LogoutSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        refresh_token = serializer.validated_data.get("refresh")
-        if not refresh_token:
+        data = request.data if isinstance(request.data, dict) else {}
+        refresh_token = data.get("refresh")
+        if not isinstance(refresh_token, str) or not refresh_token:
             raise ValidationError({"detail": "Refresh token is required."})
 
         try:
             token = RefreshToken(refresh_token)
             token.blacklist()
             return Response({"message": "Logout successful."}, status=status.HTTP_200_OK)
-        except Exception:
+        except TokenError:
             raise ValidationError({"detail": "Invalid token or token already blacklisted."})
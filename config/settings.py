@@ -10,13 +10,26 @@ from decouple import config
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+def _csv(value):
+    """Cast a comma-separated env value to a list, ignoring blank entries."""
+    return [s.strip() for s in value.split(',') if s.strip()]
+
+
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = config('SECRET_KEY', default='django-insecure-change-this-in-production-123456789')
 
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = config('DEBUG', default=True, cast=bool)
 
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=lambda v: [s.strip() for s in v.split(',')])
+# Serve only the JWT API: drops the session, CSRF, auth and messages middleware and,
+# since it depends on them, the admin. Run the admin from a deployment with this off.
+API_ONLY = config('API_ONLY', default=False, cast=bool)
+
+# OpenAPI schema support (drf-spectacular apps and OpenApiExample objects). The schema
+# is only served under DEBUG; enable explicitly to generate it in other environments.
+API_SCHEMA = config('API_SCHEMA', default=DEBUG, cast=bool)
+
+ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=_csv)
 
 
 # Application definition
@@ -34,17 +47,22 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'rest_framework_simplejwt.token_blacklist',
     'corsheaders',
-    'drf_spectacular',
-    'drf_spectacular_sidecar',
     
     # Local apps
     'authentication',
 ]
 
+if API_SCHEMA:
+    INSTALLED_APPS += ['drf_spectacular', 'drf_spectacular_sidecar']
+
+if API_ONLY:
+    INSTALLED_APPS.remove('django.contrib.admin')
+
 MIDDLEWARE = [
+    # First, so CORS preflight requests are answered before any other middleware runs
+    'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -52,6 +70,17 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+if API_ONLY:
+    MIDDLEWARE = [
+        m for m in MIDDLEWARE
+        if m not in (
+            'django.contrib.sessions.middleware.SessionMiddleware',
+            'django.middleware.csrf.CsrfViewMiddleware',
+            'django.contrib.auth.middleware.AuthenticationMiddleware',
+            'django.contrib.messages.middleware.MessageMiddleware',
+        )
+    ]
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -78,7 +107,7 @@ if not config('POSTGRES_DB', default=None):
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            'NAME': str(BASE_DIR / 'db.sqlite3'),
         }
     }
 else:
@@ -91,6 +120,13 @@ else:
             'PASSWORD': config('POSTGRES_PASSWORD', default='postgres'),
             'HOST': config('DB_HOST', default='localhost'),
             'PORT': config('DB_PORT', default='5432'),
+            # Reuse connections across requests instead of reconnecting every time
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=600, cast=int),
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'connect_timeout': config('DB_CONNECT_TIMEOUT', default=2, cast=int),
+                'options': f"-c statement_timeout={config('DB_STATEMENT_TIMEOUT_MS', default=5000, cast=int)}",
+            },
         }
     }
 
@@ -133,8 +169,8 @@ if config('IS_LIVE', default=False, cast=bool):
     STATIC_ROOT = '/vol/static'
     MEDIA_ROOT = '/vol/media'
 else:
-    STATIC_ROOT = BASE_DIR / 'static'
-    MEDIA_ROOT = BASE_DIR / 'media'
+    STATIC_ROOT = str(BASE_DIR / 'static')
+    MEDIA_ROOT = str(BASE_DIR / 'media')
 
 
 # Default primary key field type
@@ -145,25 +181,38 @@ AUTH_USER_MODEL = 'authentication.User'
 
 # REST Framework settings
 REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_SCHEMA_CLASS": (
+        "drf_spectacular.openapi.AutoSchema" if API_SCHEMA else "rest_framework.schemas.openapi.AutoSchema"
+    ),
 
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'authentication.auth.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'rest_framework.parsers.JSONParser',
+        'core.parsers.ORJSONParser',
     ),
     
     "EXCEPTION_HANDLER": "core.exceptions.custom_exception_handler",
 }
 
 # JWT Settings
+# HS256 signs with SECRET_KEY. EdDSA (Ed25519) signs with a PEM keypair, which lets
+# other services verify tokens with the public key alone at low verification cost.
+JWT_ALGORITHM = config('JWT_ALGORITHM', default='HS256')
+
+if JWT_ALGORITHM == 'EdDSA':
+    JWT_SIGNING_KEY = Path(config('JWT_PRIVATE_KEY_PATH')).read_text()
+    JWT_VERIFYING_KEY = Path(config('JWT_PUBLIC_KEY_PATH')).read_text()
+else:
+    JWT_SIGNING_KEY = SECRET_KEY
+    JWT_VERIFYING_KEY = None
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -171,9 +220,9 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,
     'UPDATE_LAST_LOGIN': True,
     
-    'ALGORITHM': 'HS256',
-    'SIGNING_KEY': SECRET_KEY,
-    'VERIFYING_KEY': None,
+    'ALGORITHM': JWT_ALGORITHM,
+    'SIGNING_KEY': JWT_SIGNING_KEY,
+    'VERIFYING_KEY': JWT_VERIFYING_KEY,
     'AUDIENCE': None,
     'ISSUER': None,
     
@@ -186,6 +235,10 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
 }
 
+# How long CachedJWTAuthentication reuses a verified access token and its user.
+# Entries never outlive the token's own expiry (ACCESS_TOKEN_LIFETIME).
+JWT_VERIFY_CACHE_SECONDS = config('JWT_VERIFY_CACHE_SECONDS', default=60, cast=int)
+
 # Spectacular Settings
 SPECTACULAR_SETTINGS = {
     "TITLE": "AI-Interview API",
@@ -239,11 +292,13 @@ SPECTACULAR_SETTINGS = {
 CORS_ALLOWED_ORIGINS = config(
     'CORS_ALLOWED_ORIGINS',
     default='http://localhost:3000,http://127.0.0.1:3000',
-    cast=lambda v: [s.strip() for s in v.split(',')]
+    cast=_csv
 )
 
-if DEBUG:
-    CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_ALL_ORIGINS = DEBUG
+
+# Only the API is called cross-origin; admin and static paths skip CORS handling
+CORS_URLS_REGEX = r'^/api/.*$'
 
 CORS_ALLOW_CREDENTIALS = True
 
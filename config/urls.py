@@ -2,31 +2,38 @@
 URL configuration for config project.
 """
 from django.conf import settings
-from django.contrib import admin
 from django.urls import path, include
-
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from django.views.decorators.cache import cache_page
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/v1/auth/', include('authentication.urls')),
 ]
 
+if not settings.API_ONLY:
+    from django.contrib import admin
+
+    urlpatterns += [
+        path('admin/', admin.site.urls),
+    ]
+
 # Swagger URLs
-if settings.DEBUG:
+if settings.DEBUG and settings.API_SCHEMA:
+    from drf_spectacular.views import (
+        SpectacularAPIView,
+        SpectacularRedocView,
+        SpectacularSwaggerView,
+    )
+
     urlpatterns += [
-        path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+        # The schema only changes with the code, so cache the generated document
+        path("api/schema/", cache_page(60 * 60)(SpectacularAPIView.as_view()), name="schema"),
         path("api/docs/swagger/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
         path("api/docs/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     ]
     
     # # Tokens
+    # from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+    #
     # urlpatterns += [
     #     path("api/v1/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     #     path("api/v1/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
@@ -1,20 +1,31 @@
 # core/exceptions.py
 
+import functools
+
+from django.core.exceptions import PermissionDenied as DjangoPermissionDenied
+from rest_framework import exceptions
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
 
 
+# Keyed by exact exception class; unlisted classes fall back to their name
 EXCEPTION_CODE_MAP = {
-    "ValidationError": "validation_error",
-    "NotAuthenticated": "not_authenticated",
-    "AuthenticationFailed": "invalid_credentials",
-    "PermissionDenied": "permission_denied",
-    "NotFound": "not_found",
-    "MethodNotAllowed": "method_not_allowed",
+    exceptions.ValidationError: "validation_error",
+    exceptions.NotAuthenticated: "not_authenticated",
+    exceptions.AuthenticationFailed: "invalid_credentials",
+    exceptions.PermissionDenied: "permission_denied",
+    DjangoPermissionDenied: "permission_denied",
+    exceptions.NotFound: "not_found",
+    exceptions.MethodNotAllowed: "method_not_allowed",
 }
 
 
+@functools.cache
+def _code_for(exc_type):
+    return EXCEPTION_CODE_MAP.get(exc_type) or exc_type.__name__
+
+
 def custom_exception_handler(exc, context):
     """
     Wrap all DRF exceptions in a unified frontend-friendly format:
@@ -27,36 +38,30 @@ def custom_exception_handler(exc, context):
 
     if response is not None:
         # Determine a consistent code
-        code = EXCEPTION_CODE_MAP.get(exc.__class__.__name__, exc.__class__.__name__)
+        code = _code_for(type(exc))
 
-        # Determine message
-        message = "Validation failed."
+        # Fast path: the common {"detail": "..."} shape
+        data = response.data
+        if isinstance(data, dict) and len(data) == 1 and isinstance(data.get("detail"), str):
+            response.data = {"code": code, "message": data["detail"]}
+            return response
 
-        if isinstance(response.data, dict):
-            # DRF validation errors can be dict or list
-            if "detail" in response.data:
-                # `detail` can be a string or list
-                if isinstance(response.data["detail"], list):
-                    message = " ".join(str(i) for i in response.data["detail"])
-                else:
-                    message = str(response.data["detail"])
-            else:
-                # Take the first error message if dict of field errors
-                first_error = next(iter(response.data.values()))
-                if isinstance(first_error, list):
-                    message = " ".join(str(i) for i in first_error)
-                else:
-                    message = str(first_error)
-        elif isinstance(response.data, list):
+        # Determine message
+        if isinstance(data, dict):
+            # `detail` can be a string or list; otherwise take the first field error
+            error = data["detail"] if "detail" in data else next(iter(data.values()))
+        else:
             # Rare case: DRF returns a list of errors
-            message = " ".join(str(i) for i in response.data)
+            error = data
+
+        if isinstance(error, list):
+            message = str(error[0]) if len(error) == 1 else " ".join(map(str, error))
         else:
-            message = str(response.data)
-        
-        return Response(
-            {"code": code, "message": message},
-            status=response.status_code
-        )
+            message = str(error)
+
+        # Reuse DRF's response so its headers (WWW-Authenticate, Retry-After, ...) are kept
+        response.data = {"code": code, "message": message}
+        return response
 
     # Fallback for unhandled exceptions
     return Response(
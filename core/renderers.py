@@ -0,0 +1,23 @@
+import orjson
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+
+_fallback_encoder = encoders.JSONEncoder()
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer backed by orjson. Types orjson does not handle natively
+    (lazy translation strings, Decimal, ...) go through DRF's JSON encoder.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=_fallback_encoder.default, option=option)
@@ -1,3 +1,5 @@
+import copy
+
 from rest_framework import serializers
 
 
@@ -11,3 +13,16 @@ class ErrorResponseSerializer(serializers.Serializer):
     message = serializers.CharField(
         help_text="Human-readable message that can be displayed to the user."
     )
+
+
+class CachedFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that introspects its model fields once per class.
+    Each instance still receives its own copy of the fields to bind.
+    """
+
+    def get_fields(self):
+        cls = self.__class__
+        if "_cached_fields" not in cls.__dict__:
+            cls._cached_fields = super().get_fields()
+        return copy.deepcopy(cls._cached_fields)